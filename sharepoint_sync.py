@@ -11,9 +11,14 @@ It supports:
   - Multiple profiles for different SharePoints
 
 Requires:
-  - python-docx
   - pyfiglet
   - click
+  - colorlog
+
+Optional:
+  - orjson (faster config loading/saving; falls back to json)
+  - diff-match-patch (faster diffs of large documents when git is not installed)
+  - lxml (faster Word text extraction; falls back to xml.etree)
 
 Usage:
   - python sharepoint_sync.py setup
@@ -22,27 +27,80 @@ Usage:
   - python sharepoint_sync.py exclude_file <file_name>
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
+import ctypes
+import errno
 import os
 import shutil
-import filecmp
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import functools
+import hashlib
+import itertools
 import json
 import logging
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from xml.etree import ElementTree
+from typing import Callable, Dict, FrozenSet, List, Optional, TextIO, Tuple, Set
 import click
-import difflib
 import colorlog
-import pyfiglet
-from docx import Document
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diff_match_patch import diff_match_patch
+except ImportError:
+    diff_match_patch = None
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
 
 # ------------------------------------------------------------------------------
 # Configuration Constants & Logger Setup
 # ------------------------------------------------------------------------------
 CONFIG_FILE = Path.home() / ".sharepoint_sync_profiles.json"
+CACHE_FILE = Path.home() / ".sharepoint_sync_cache.db"
 DEFAULT_EXCLUDED_FILES: List[str] = []
 DEFAULT_EXCLUDED_DIRS: List[str] = []
 FOLLOW_UP_FILE = Path("follow_up_tasks.md")
+HASH_CHUNK_SIZE = 1024 * 1024
+COPY_CHUNK_SIZE = 64 * 1024 * 1024
+MAX_COPY_WORKERS = 32
+DEFAULT_WALK_WORKERS = 8
+# copy_file_range errors that mean "not supported here" rather than a real failure
+COPY_FILE_RANGE_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+MTIME_TOLERANCE_NS = 2_000_000_000  # FAT/SMB only store mtimes at 2s resolution
+
+# diff-match-patch is only worth it over difflib for larger texts
+DMP_MIN_TEXT_SIZE = 4 * 1024
+DMP_TIMEOUT = 1.0  # seconds
+DIFF_CONTEXT_LINES = 3
+# difflib is quadratic in the worst case, so larger texts only get a summary
+DIFFLIB_MAX_TEXT_SIZE = 200 * 1024
+DIFFLIB_MAX_LINES = 2000
+DIFFLIB_CONTEXT_LINES = 1  # less context keeps the capped output focused on changes
+
+# Word formats whose text can be extracted and diffed
+DIFFABLE_EXTS = (".docx", ".docm")
+
+# WordprocessingML tags read when extracting text from .docx files
+WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+WORD_PARAGRAPH = WORD_NAMESPACE + "p"
+WORD_TEXT = WORD_NAMESPACE + "t"
+DOCX_SPECIAL_CHARS = {
+    WORD_NAMESPACE + "tab": "\t",
+    WORD_NAMESPACE + "br": "\n",
+    WORD_NAMESPACE + "cr": "\n",
+}
 
 # Create a logger
 logger = logging.getLogger("SharePoint Sync")
@@ -66,18 +124,131 @@ logger.addHandler(console_handler)
 # ------------------------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------------------------
+# Kept open between follow-ups so declining many files costs a single open
+_follow_up_file: Optional[TextIO] = None
+
 def log_follow_up(task: str) -> None:
     """
     Appends a task/instruction to 'follow_up_tasks.md', timestamped.
+    The file is opened on first use and stays open until close_follow_up_file().
     """
+    global _follow_up_file
+    if _follow_up_file is None:
+        _follow_up_file = FOLLOW_UP_FILE.open("a", encoding="utf-8")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    with FOLLOW_UP_FILE.open("a", encoding="utf-8") as f:
-        f.write(f"### {timestamp}\n")
-        f.write(task.strip() + "\n\n")
+    _follow_up_file.write(f"### {timestamp}\n")
+    _follow_up_file.write(task.strip() + "\n\n")
+    _follow_up_file.flush()
+
+def close_follow_up_file() -> None:
+    """
+    Closes 'follow_up_tasks.md' if log_follow_up() opened it.
+    """
+    global _follow_up_file
+    if _follow_up_file is not None:
+        _follow_up_file.close()
+        _follow_up_file = None
+
+def walk_workers() -> int:
+    """
+    Returns the number of threads used to list directories, taken from the
+    SPSYNC_THREADS environment variable (default DEFAULT_WALK_WORKERS).
+    """
+    value = os.environ.get("SPSYNC_THREADS", "")
+    try:
+        return max(1, int(value)) if value else DEFAULT_WALK_WORKERS
+    except ValueError:
+        logger.warning(f"Ignoring invalid SPSYNC_THREADS value '{value}'.")
+        return DEFAULT_WALK_WORKERS
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copies the content and timestamps of `src` to `dst`, letting the kernel do
+    the copy where possible: CopyFileExW on Windows, copy_file_range on Linux,
+    falling back to shutil.copyfile elsewhere or across filesystems.
+    """
+    if dst.exists() and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src} and {dst} are the same file")
+
+    if os.name == "nt":
+        # CopyFileExW carries timestamps and attributes over by itself
+        if not ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+            raise ctypes.WinError()
+        return
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                # Stat and stamp through the open descriptors, saving two path
+                # lookups (network round trips on mounted SharePoints)
+                src_stat = os.fstat(fsrc.fileno())
+                copied = 0
+                while True:
+                    size = os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_CHUNK_SIZE)
+                    if not size:
+                        break
+                    copied += size
+                # Some filesystems (FUSE, pseudo-files) report 0 before EOF;
+                # never stamp the source mtime onto a short copy
+                if copied == src_stat.st_size:
+                    os.utime(fdst.fileno(), ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                    return
+            logger.debug("copy_file_range stopped short for %s, falling back", src)
+        except OSError as exc:
+            if exc.errno not in COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                raise
+    src_stat = os.stat(src)
+    shutil.copyfile(src, dst)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+def copy_files(copies: List[Tuple[Path, Path]], description: str) -> None:
+    """
+    Runs the given (source, destination) copies concurrently, creating missing
+    parent directories once per directory rather than once per file. Copies on
+    network drives are latency bound, so overlapping them keeps the link busy.
+    Failures are collected and reported together once all copies have finished.
+    """
+    if not copies:
+        return
+
+    def make_dir(directory: Path) -> Optional[Exception]:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except Exception as exc:
+            return exc
+        return None
+
+    def copy_one(copy: Tuple[Path, Path]) -> Optional[Exception]:
+        src, dst = copy
+        dir_error = dir_errors[dst.parent]
+        if dir_error is not None:
+            return dir_error
+        try:
+            fast_copy(src, dst)
+        except Exception as exc:
+            return exc
+        return None
+
+    parents = {dst.parent for _, dst in copies}
+    with ThreadPoolExecutor(max_workers=min(MAX_COPY_WORKERS, len(copies))) as executor:
+        dir_errors = dict(zip(parents, executor.map(make_dir, parents)))
+        errors = list(executor.map(copy_one, copies))
+
+    failures = [(src, dst, exc) for (src, dst), exc in zip(copies, errors) if exc is not None]
+    copied = len(copies) - len(failures)
+    if copied:
+        logger.info(f"Successfully copied {copied} file(s) {description}.")
+    if failures:
+        logger.error(f"{len(failures)} file(s) could not be copied {description}:")
+        for src, dst, exc in failures:
+            logger.error(f" - {src} -> {dst}: {type(exc).__name__}: {exc}")
 
 # ------------------------------------------------------------------------------
 # Data Structures
 # ------------------------------------------------------------------------------
+# A file found while walking a SharePoint: (absolute_path, size, mtime_ns)
+FileEntry = Tuple[str, int, int]
+
 class SyncProfile:
     """
     Holds the paths for a single synchronization profile (KIS and Client).
@@ -112,25 +283,38 @@ def load_profiles() -> Dict:
                 ...
             }
         }
+    The parsed file is reused until its mtime changes or save_profiles() runs.
+    """
+    try:
+        mtime_ns: Optional[int] = CONFIG_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return read_profiles(mtime_ns)
+
+@functools.lru_cache(maxsize=1)
+def read_profiles(mtime_ns: Optional[int]) -> Dict:
+    """
+    Parses the profiles configuration file. `mtime_ns` is None when the file
+    does not exist; otherwise it only serves as the cache key.
     """
     logger.debug(f"Loading profiles from {CONFIG_FILE}")
-    if CONFIG_FILE.exists():
+    if mtime_ns is not None:
         try:
-            with open(CONFIG_FILE, "r") as f:
-                return json.load(f)
+            data = CONFIG_FILE.read_bytes()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
         except (json.JSONDecodeError, OSError) as exc:
             logger.error(f"Failed to parse config file {CONFIG_FILE}: {exc}")
             # Return minimal default structure on error
             return {
-                "excluded_files": DEFAULT_EXCLUDED_FILES,
-                "excluded_dirs": DEFAULT_EXCLUDED_DIRS,
+                "excluded_files": list(DEFAULT_EXCLUDED_FILES),
+                "excluded_dirs": list(DEFAULT_EXCLUDED_DIRS),
                 "profiles": {}
             }
     else:
         # Return default structure if file doesn't exist
         return {
-            "excluded_files": DEFAULT_EXCLUDED_FILES,
-            "excluded_dirs": DEFAULT_EXCLUDED_DIRS,
+            "excluded_files": list(DEFAULT_EXCLUDED_FILES),
+            "excluded_dirs": list(DEFAULT_EXCLUDED_DIRS),
             "profiles": {}
         }
 
@@ -139,9 +323,14 @@ def save_profiles(profiles: Dict) -> None:
     Writes the profiles dictionary back to disk.
     """
     logger.debug(f"Saving profiles to {CONFIG_FILE}")
+    read_profiles.cache_clear()
     try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(profiles, f, indent=4)
+        # Serialize in memory first: one write instead of one per JSON token
+        if orjson is not None:
+            data = orjson.dumps(profiles, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(profiles, indent=4).encode("utf-8")
+        CONFIG_FILE.write_bytes(data)
     except OSError as exc:
         logger.error(f"Failed to write config file {CONFIG_FILE}: {exc}")
         raise
@@ -149,22 +338,113 @@ def save_profiles(profiles: Dict) -> None:
 # ------------------------------------------------------------------------------
 # Word Document Handling
 # ------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=64)
+def read_docx_text(path: str, size: int, mtime_ns: int) -> str:
+    """
+    Reads the text of a .docx file by streaming `word/document.xml` out of the
+    archive, one line per paragraph. Elements are cleared as soon as they are
+    read, so the document is never held in memory as a whole.
+
+    `size` and `mtime_ns` are only part of the cache key: an edited file gets a
+    new key and is parsed again, while an unchanged one is served from memory.
+    """
+    paragraphs = []
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml_file:
+        if lxml_etree is not None:
+            # lxml filters paragraphs in C and only visits text-bearing nodes
+            text_tags = (WORD_TEXT, *DOCX_SPECIAL_CHARS)
+            for _, element in lxml_etree.iterparse(xml_file, events=("end",), tag=WORD_PARAGRAPH):
+                paragraphs.append("".join(
+                    (node.text or "") if node.tag == WORD_TEXT else DOCX_SPECIAL_CHARS[node.tag]
+                    for node in element.iter(*text_tags)
+                ))
+                element.clear()
+            return "\n".join(paragraphs)
+        for _, element in ElementTree.iterparse(xml_file, events=("end",)):
+            if element.tag == WORD_PARAGRAPH:
+                paragraphs.append("".join(
+                    (node.text or "") if node.tag == WORD_TEXT else DOCX_SPECIAL_CHARS.get(node.tag, "")
+                    for node in element.iter()
+                ))
+                element.clear()
+    return "\n".join(paragraphs)
+
 def extract_text_from_docx(file_path: Path) -> str:
     """
-    Extracts text from a .docx file using the `docx` library.
+    Extracts text from a .docx file, reusing the cached text while the file's
+    size and mtime are unchanged.
     Returns the extracted text or an error message if something fails.
     """
     try:
-        doc = Document(file_path)
-        return "\n".join(para.text for para in doc.paragraphs)
+        stat_result = file_path.stat()
+        return read_docx_text(str(file_path), stat_result.st_size, stat_result.st_mtime_ns)
     except Exception as exc:
         error_msg = f"[Error extracting text from {file_path}: {exc}]"
         logger.error(error_msg)
         return error_msg
 
+def git_diff_text(text1: str, text2: str) -> Optional[str]:
+    """
+    Diffs two texts with `git diff --no-index`, whose C implementation is much
+    faster than difflib on large documents. Returns the colored hunks without
+    git's file header, or None if git is unavailable or fails.
+    """
+    git = shutil.which("git")
+    if git is None:
+        return None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        old_file = Path(tmp_dir) / "old.txt"
+        new_file = Path(tmp_dir) / "new.txt"
+        # Bytes, not write_text: CRLF on Windows would flag every line as trailing whitespace
+        old_file.write_bytes((text1 + "\n").encode("utf-8"))
+        new_file.write_bytes((text2 + "\n").encode("utf-8"))
+        # --no-ext-diff: a configured diff.external tool would bypass git's own diff
+        result = subprocess.run(
+            [git, "diff", "--no-index", "--no-ext-diff", "--color=always", str(old_file), str(new_file)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False
+        )
+    # Exit code 1 means "files differ"; anything above that is an error
+    if result.returncode > 1:
+        logger.debug(f"git diff failed: {result.stderr.decode('utf-8', errors='replace')}")
+        return None
+    lines = result.stdout.decode("utf-8", errors="replace").splitlines()
+    first_hunk = next((i for i, line in enumerate(lines) if "@@" in line), len(lines))
+    return "\n".join(lines[first_hunk:])
+
+def dmp_diff_text(text1: str, text2: str) -> Optional[str]:
+    """
+    Diffs two texts with diff-match-patch (Myers' O(ND) algorithm, bounded by
+    DMP_TIMEOUT seconds) and returns them as one string with removals in red
+    and additions in green. Unchanged stretches are cut down to
+    DIFF_CONTEXT_LINES lines on either side of a change.
+    Returns None if diff-match-patch is not installed.
+    """
+    if diff_match_patch is None:
+        return None
+    dmp = diff_match_patch()
+    dmp.Diff_Timeout = DMP_TIMEOUT
+    diffs = dmp.diff_main(text1, text2)
+    dmp.diff_cleanupSemantic(diffs)
+    colors = {dmp.DIFF_DELETE: "red", dmp.DIFF_INSERT: "green"}
+    chunks = []
+    for index, (op, data) in enumerate(diffs):
+        if op in colors:
+            chunks.append(click.style(data, fg=colors[op]))
+            continue
+        lines = data.split("\n")
+        # Context after the previous change and before the next one
+        head = lines[:DIFF_CONTEXT_LINES + 1] if index > 0 else []
+        tail = lines[-DIFF_CONTEXT_LINES - 1:] if index < len(diffs) - 1 else []
+        if len(head) + len(tail) < len(lines):
+            data = "\n".join(head + ["..."] + tail)
+        chunks.append(data)
+    return "".join(chunks)
+
 def show_file_diff(file1: Path, file2: Path) -> None:
     """
-    Displays a unified diff of two .docx files to the console.
+    Displays a unified diff of two Word documents (see DIFFABLE_EXTS) to the console.
     """
     try:
         file1_text = extract_text_from_docx(file1)
@@ -176,93 +456,407 @@ def show_file_diff(file1: Path, file2: Path) -> None:
             return
 
         click.echo("\nShowing diff:")
-        diff = difflib.unified_diff(
-            file1_text.splitlines(),
-            file2_text.splitlines(),
-            fromfile=str(file1),
-            tofile=str(file2),
-            lineterm=''
-        )
-        for line in diff:
-            if line.startswith("-"):
-                click.echo(click.style(line, fg="red"))  # Removed content
-            elif line.startswith("+"):
-                click.echo(click.style(line, fg="green"))  # Added content
-            else:
-                click.echo(line)
+        diff_output = git_diff_text(file1_text, file2_text)
+        if diff_output is None and max(len(file1_text), len(file2_text)) >= DMP_MIN_TEXT_SIZE:
+            # Without git, large texts go through diff-match-patch if installed
+            diff_output = dmp_diff_text(file1_text, file2_text)
+        if diff_output is not None:
+            click.echo(click.style(f"--- {file1}", fg="red"))
+            click.echo(click.style(f"+++ {file2}", fg="green"))
+            click.echo(diff_output)
+        elif max(len(file1_text), len(file2_text)) > DIFFLIB_MAX_TEXT_SIZE:
+            lines1 = file1_text.count("\n") + 1
+            lines2 = file2_text.count("\n") + 1
+            click.echo(
+                f"Files too large for a detailed diff: {len(file1_text):,} vs "
+                f"{len(file2_text):,} characters ({lines1:,} vs {lines2:,} lines)."
+            )
+        else:
+            # Fall back to difflib for small texts or when neither is available
+            import difflib
+            diff = difflib.unified_diff(
+                file1_text.splitlines(),
+                file2_text.splitlines(),
+                fromfile=str(file1),
+                tofile=str(file2),
+                lineterm='',
+                n=DIFFLIB_CONTEXT_LINES
+            )
+            # Stop pulling hunks from the generator once the cap is reached
+            lines = []
+            for line in itertools.islice(diff, DIFFLIB_MAX_LINES):
+                if line.startswith("-"):
+                    lines.append(click.style(line, fg="red"))  # Removed content
+                elif line.startswith("+"):
+                    lines.append(click.style(line, fg="green"))  # Added content
+                else:
+                    lines.append(line)
+            if next(diff, None) is not None:
+                lines.append(f"... diff truncated at {DIFFLIB_MAX_LINES} lines ...")
+            # One write for the whole diff instead of one per line
+            click.echo("\n".join(lines))
         click.echo("")
     except Exception as exc:
         logger.exception(f"Could not generate diff for {file1} vs {file2}: {exc}")
 
+# ------------------------------------------------------------------------------
+# File Hashing
+# ------------------------------------------------------------------------------
+def file_digest(file_path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of a file's content, read in
+    HASH_CHUNK_SIZE chunks so large files are never loaded at once. Chunks are
+    read into one reusable buffer, unbuffered, so no bytes object is allocated
+    per chunk. SHA-256 rather than BLAKE2b because OpenSSL runs it on the CPU's
+    SHA extensions where available, roughly twice as fast.
+    """
+    hasher = hashlib.sha256()
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+class HashCache:
+    """
+    Persistent cache of file digests keyed on (path, size, mtime_ns), stored in
+    a SQLite database. An entry is only reused while the file's size and mtime
+    are unchanged, so edited files are rehashed automatically. New digests are
+    buffered and written in a single transaction on `close()`. With
+    `read_only`, the database is never created or written to.
+    """
+    def __init__(self, cache_path: Path = CACHE_FILE, read_only: bool = False) -> None:
+        self.cache_path = cache_path
+        self.read_only = read_only
+        self.pending: List[Tuple[str, int, int, str]] = []
+        try:
+            if read_only:
+                self.conn: Optional[sqlite3.Connection] = sqlite3.connect(
+                    f"{cache_path.as_uri()}?mode=ro", uri=True
+                )
+                self.conn.execute("SELECT 1 FROM sha256_hashes LIMIT 1")
+            else:
+                self.conn = sqlite3.connect(str(cache_path))
+                self.conn.execute(
+                    "CREATE TABLE IF NOT EXISTS sha256_hashes ("
+                    "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, hash TEXT)"
+                )
+        except sqlite3.Error as exc:
+            if read_only:
+                # No cache yet is normal; digests just aren't known
+                logger.debug(f"Hash cache {cache_path} not readable: {exc}")
+            else:
+                logger.warning(f"Hash cache {cache_path} unavailable, hashing without it: {exc}")
+            self.conn = None
+
+    def get(self, file_path: str, size: int, mtime_ns: int) -> Optional[str]:
+        """
+        Returns the cached digest for `file_path` if its size and mtime still
+        match, without hashing anything.
+        """
+        if self.conn is None:
+            return None
+        row = self.conn.execute(
+            "SELECT hash FROM sha256_hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (file_path, size, mtime_ns)
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_or_compute(self, file_path: str, size: int, mtime_ns: int) -> str:
+        """
+        Returns the cached digest for `file_path` if its size and mtime still
+        match, otherwise hashes the file and queues the result for saving.
+        """
+        digest = self.get(file_path, size, mtime_ns)
+        if digest is None:
+            digest = file_digest(file_path)
+            self.pending.append((file_path, size, mtime_ns, digest))
+        return digest
+
+    def close(self) -> None:
+        """
+        Writes the queued digests in one transaction and closes the database.
+        """
+        if self.conn is None:
+            return
+        try:
+            if self.read_only:
+                return
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO sha256_hashes (path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                    self.pending
+                )
+        except sqlite3.Error as exc:
+            logger.warning(f"Failed to update hash cache {self.cache_path}: {exc}")
+        finally:
+            self.pending.clear()
+            self.conn.close()
+            self.conn = None
+
+def files_equal(path1: str, path2: str) -> bool:
+    """
+    Compares two files in HASH_CHUNK_SIZE blocks, read in lockstep, and stops
+    at the first block that differs. Real differences tend to show up early, so
+    differing files are rarely read to the end.
+    """
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        while True:
+            block1 = f1.read(HASH_CHUNK_SIZE)
+            if block1 != f2.read(HASH_CHUNK_SIZE):
+                return False
+            if not block1:
+                return True
+
+def fast_file_equal(
+    entry1: FileEntry,
+    entry2: FileEntry,
+    known_digest: Optional[Callable[[FileEntry], Optional[str]]] = None,
+    read_content: bool = True
+) -> bool:
+    """
+    Decides whether two (path, size, mtime_ns) entries have the same content,
+    as cheaply as possible: different sizes are never equal, and equal sizes
+    with mtimes within MTIME_TOLERANCE_NS are assumed equal. Next, digests
+    already known through `known_digest` are compared. Only when neither
+    shortcut applies are the files read, with an early exit on the first
+    difference; with `read_content` off they are reported as different.
+    """
+    path1, size1, mtime1_ns = entry1
+    path2, size2, mtime2_ns = entry2
+    if size1 != size2:
+        return False
+    if abs(mtime1_ns - mtime2_ns) < MTIME_TOLERANCE_NS:
+        return True
+    if known_digest is not None:
+        digest1 = known_digest(entry1)
+        digest2 = known_digest(entry2) if digest1 is not None else None
+        if digest1 is not None and digest2 is not None:
+            return digest1 == digest2
+    if not read_content:
+        return False
+    try:
+        return files_equal(path1, path2)
+    except OSError as exc:
+        logger.warning(f"Could not compare {path1} and {path2}: {exc}")
+        return False
+
 # ------------------------------------------------------------------------------
 # SharePoint Comparison
 # ------------------------------------------------------------------------------
+def scan_directory(
+    dirpath: str,
+    rel_prefix: str,
+    excluded_dirs_set: FrozenSet[str],
+    excluded_files_set: FrozenSet[str]
+) -> Tuple[List[Tuple[str, str]], Dict[str, FileEntry], List[str]]:
+    """
+    Lists a single directory with os.scandir. `rel_prefix` is the directory's
+    path relative to the walk root, with a trailing separator (empty for the
+    root itself). Returns the (path, rel_prefix) pairs of the subdirectories
+    still to visit, a dict of {relative_path: (absolute_path, size, mtime_ns)}
+    for the files that are not excluded, and the relative paths that could not
+    be read: single entries, or `rel_prefix` itself if the directory could not
+    be listed. Excluded directories are dropped here so their subtrees are
+    never listed, and the stat info comes from the DirEntry at discovery time
+    so callers never re-stat.
+    """
+    subdirs = []
+    files = {}
+    skipped = []
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in excluded_dirs_set:
+                            logger.debug("Excluding directory: %s", entry.path)
+                            continue
+                        subdirs.append((entry.path, rel_prefix + entry.name + os.sep))
+                    elif entry.is_file(follow_symlinks=False):
+                        if entry.name in excluded_files_set:
+                            logger.debug("Excluding file due to name: %s", entry.path)
+                            continue
+                        stat_result = entry.stat(follow_symlinks=False)
+                        # Building the relative path from the prefix avoids os.path.relpath
+                        files[rel_prefix + entry.name] = (
+                            entry.path,
+                            stat_result.st_size,
+                            stat_result.st_mtime_ns
+                        )
+                except OSError as exc:
+                    # Typically an Office ~$ lock file removed between readdir and stat
+                    logger.debug("Skipping unreadable entry %s: %s", entry.path, exc)
+                    skipped.append(rel_prefix + entry.name)
+    except OSError as exc:
+        logger.warning(f"Could not list directory {dirpath}: {exc}")
+        return [], {}, [rel_prefix]
+    return subdirs, files, skipped
+
+def walk_sharepoints(
+    roots: List[Path],
+    excluded_dirs_set: FrozenSet[str],
+    excluded_files_set: FrozenSet[str]
+) -> Tuple[List[Dict[str, FileEntry]], List[str]]:
+    """
+    Walks all `roots` at once, listing directories on a thread pool of
+    walk_workers() threads. On network-mounted SharePoints every listing is a
+    round trip, so overlapping them hides most of the latency.
+    Returns one {relative_path: (absolute_path, size, mtime_ns)} dict per root,
+    and the relative paths that could not be read under any of the roots.
+    """
+    results: List[Dict[str, FileEntry]] = [{} for _ in roots]
+    skipped: List[str] = []
+    with ThreadPoolExecutor(max_workers=walk_workers()) as executor:
+        def submit(dirpath: str, rel_prefix: str, index: int) -> Tuple[Future, int]:
+            return executor.submit(
+                scan_directory, dirpath, rel_prefix, excluded_dirs_set, excluded_files_set
+            ), index
+
+        pending = dict(submit(str(root), "", index) for index, root in enumerate(roots))
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                subdirs, files, unreadable = future.result()
+                results[index].update(files)
+                skipped.extend(unreadable)
+                pending.update(submit(subdir, rel_prefix, index) for subdir, rel_prefix in subdirs)
+    return results, skipped
+
 def compare_sharepoints(
     kis_dir: Path,
     client_dir: Path,
     excluded_files: List[str],
-    excluded_dirs: List[str]
-) -> Tuple[Set[str], Set[str], Dict[str, Tuple[str, str]], Dict[str, Path]]:
+    excluded_dirs: List[str],
+    read_content: bool = True
+) -> Tuple[Set[str], Set[str], Dict[str, Tuple[str, str, bool]], Dict[str, Path]]:
     """
     Compare two directories (kis_dir and client_dir), ignoring the given excluded
-    files and directories. Returns a tuple of:
+    files and directories. With `read_content` off, only sizes, mtimes and
+    digests cached by earlier runs are used; no file is read. Paths that could
+    not be read on either side are left out of both; raises OSError if a root
+    itself cannot be listed. Returns a tuple of:
       (kis_only, client_only, moved_files, updated_files)
 
     kis_only: Set of relative paths that exist only in KIS.
     client_only: Set of relative paths that exist only in the client.
-    moved_files: Dict[file_name -> (kis_relative_path, client_relative_path)]
+    moved_files: Dict[kis_relative_path -> (file_name, client_relative_path, identical)]
     updated_files: Dict[relative_path -> Path_of_latest_file]
     """
     logger.debug("Comparing KIS and Client SharePoints...")
-    logger.debug(f"Excluded files: {excluded_files}")
-    logger.debug(f"Excluded dirs: {excluded_dirs}")
-
-    def should_exclude(file_path: Path) -> bool:
-        if file_path.name in excluded_files:
-            logger.debug(f"Excluding file due to name: {file_path}")
-            return True
-        if any(excl in file_path.parts for excl in excluded_dirs):
-            logger.debug(f"Excluding file due to directory path: {file_path}")
-            return True
-        return False
+    logger.debug("Excluded files: %s", excluded_files)
+    logger.debug("Excluded dirs: %s", excluded_dirs)
+
+    excluded_files_set = frozenset(excluded_files)
+    excluded_dirs_set = frozenset(excluded_dirs)
+
+    (kis_files, client_files), skipped = walk_sharepoints(
+        [kis_dir, client_dir], excluded_dirs_set, excluded_files_set
+    )
 
-    kis_files = {
-        str(file.relative_to(kis_dir)): file
-        for file in kis_dir.rglob("*")
-        if file.is_file() and not should_exclude(file)
-    }
-    client_files = {
-        str(file.relative_to(client_dir)): file
-        for file in client_dir.rglob("*")
-        if file.is_file() and not should_exclude(file)
-    }
-
-    kis_only = set(kis_files) - set(client_files)
-    client_only = set(client_files) - set(kis_files)
-    common_files = set(kis_files) & set(client_files)
+    # Whatever could not be read on one side is left out on both: otherwise the
+    # other side's copies would be offered as missing and overwrite it
+    if "" in skipped:
+        raise OSError("Could not list the root of a SharePoint; aborting the comparison.")
+    if skipped:
+        logger.warning(f"Leaving {len(skipped)} unreadable path(s) out of this sync.")
+        skipped_paths = set(skipped)
+        skipped_prefixes = tuple(
+            path if path.endswith(os.sep) else path + os.sep for path in skipped
+        )
+        for files in (kis_files, client_files):
+            for rel_path in [
+                p for p in files if p in skipped_paths or p.startswith(skipped_prefixes)
+            ]:
+                del files[rel_path]
+
+    # Set algebra straight on the key views avoids copying either index
+    kis_only = kis_files.keys() - client_files.keys()
+    client_only = client_files.keys() - kis_files.keys()
+    common_files = kis_files.keys() & client_files.keys()
     moved_files = {}
     updated_files = {}
+    digests: Dict[str, Optional[str]] = {}
+    hash_cache = HashCache(read_only=not read_content)
 
-    # Detect moved files by matching filenames in different relative paths
-    for file_rel_path in kis_only.copy():
-        file_name = Path(file_rel_path).name
-        matching_file = next(
-            (cf for cf in client_only if Path(cf).name == file_name),
-            None
-        )
-        if matching_file:
-            moved_files[file_name] = (file_rel_path, matching_file)
-            kis_only.remove(file_rel_path)
-            client_only.remove(matching_file)
+    def digest(entry: FileEntry) -> Optional[str]:
+        # Hash lazily and at most once per file
+        file_path = entry[0]
+        if file_path not in digests:
+            try:
+                digests[file_path] = hash_cache.get_or_compute(*entry)
+            except OSError as exc:
+                logger.warning(f"Could not hash {file_path}: {exc}")
+                digests[file_path] = None
+        return digests[file_path]
+
+    def known_digest(entry: FileEntry) -> Optional[str]:
+        # Digest from this run or a previous one, without hashing
+        return digests.get(entry[0]) or hash_cache.get(*entry)
+
+    def same_digest(kis_entry: FileEntry, client_entry: FileEntry) -> bool:
+        lookup = digest if read_content else known_digest
+        kis_digest = lookup(kis_entry)
+        return kis_digest is not None and kis_digest == lookup(client_entry)
+
+    # Close in finally so digests computed before an error or Ctrl-C are kept
+    try:
+        # Detect moved files by matching filenames in different relative paths
+        client_by_name: Dict[str, List[str]] = {}
+        for client_rel_path in client_only:
+            client_by_name.setdefault(os.path.basename(client_rel_path), []).append(client_rel_path)
+
+        for file_rel_path in list(kis_only):
+            file_name = os.path.basename(file_rel_path)
+            matches = client_by_name.get(file_name)
+            if matches:
+                matching_file = matches.pop()
+                if not matches:
+                    del client_by_name[file_name]
+                identical = fast_file_equal(
+                    kis_files[file_rel_path], client_files[matching_file], known_digest, read_content
+                )
+                moved_files[file_rel_path] = (file_name, matching_file, identical)
+                kis_only.discard(file_rel_path)
+                client_only.discard(matching_file)
+
+        # Detect renamed files by matching size first, then content hash
+        client_by_size: Dict[int, List[str]] = {}
+        for client_rel_path in client_only:
+            client_size = client_files[client_rel_path][1]
+            if client_size:
+                client_by_size.setdefault(client_size, []).append(client_rel_path)
 
-    # Detect updated files in the common set
+        for file_rel_path in list(kis_only):
+            candidates = client_by_size.get(kis_files[file_rel_path][1])
+            if not candidates:
+                continue
+            matching_file = next(
+                (cf for cf in candidates if same_digest(kis_files[file_rel_path], client_files[cf])),
+                None
+            )
+            if matching_file:
+                candidates.remove(matching_file)
+                moved_files[file_rel_path] = (os.path.basename(file_rel_path), matching_file, True)
+                kis_only.discard(file_rel_path)
+                client_only.discard(matching_file)
+    finally:
+        hash_cache.close()
+
+    # Detect updated files in the common set; mtimes within the tolerance count
+    # as the same write on filesystems with 2s resolution
     for file_rel_path in common_files:
-        kis_file = kis_files[file_rel_path]
-        client_file = client_files[file_rel_path]
-        if kis_file.stat().st_mtime > client_file.stat().st_mtime:
-            updated_files[file_rel_path] = kis_file
-        elif client_file.stat().st_mtime > kis_file.stat().st_mtime:
-            updated_files[file_rel_path] = client_file
+        kis_file, _, kis_mtime_ns = kis_files[file_rel_path]
+        client_file, _, client_mtime_ns = client_files[file_rel_path]
+        if kis_mtime_ns > client_mtime_ns + MTIME_TOLERANCE_NS:
+            updated_files[file_rel_path] = Path(kis_file)
+        elif client_mtime_ns > kis_mtime_ns + MTIME_TOLERANCE_NS:
+            updated_files[file_rel_path] = Path(client_file)
 
     return kis_only, client_only, moved_files, updated_files
 
@@ -275,12 +869,57 @@ def log_separator(char: str = "-", length: int = 50) -> None:
     """
     click.echo(click.style(char * length, fg="cyan"))
 
+@functools.lru_cache(maxsize=4)
+def render_ascii_art(message: str, font: str) -> str:
+    """
+    Renders a message in ASCII art using pyfiglet. pyfiglet is imported here
+    because loading it and its font file is only needed for the banner.
+    """
+    import pyfiglet
+    return pyfiglet.figlet_format(message, font=font)
+
 def log_ascii_message(message: str = "SharePoint Sync", font: str = "slant") -> None:
     """
     Logs a message in ASCII art using pyfiglet.
     """
-    ascii_art = pyfiglet.figlet_format(message, font=font)
-    click.echo(click.style(ascii_art, fg="magenta"))
+    click.echo(click.style(render_ascii_art(message, font), fg="magenta"))
+
+def parse_selection(answer: str, count: int) -> Set[int]:
+    """
+    Parses a selection such as 'all', 'none' or '1,3-5' into a set of 0-based
+    indices for a list of `count` items. Raises ValueError on invalid input.
+    """
+    answer = answer.strip().lower()
+    if answer == "all":
+        return set(range(count))
+    if answer in ("", "none"):
+        return set()
+
+    selected = set()
+    for part in answer.split(","):
+        start, _, end = part.strip().partition("-")
+        first = int(start)
+        last = int(end) if end else first
+        if not 1 <= first <= last <= count:
+            raise ValueError(f"'{part.strip()}' is not within 1-{count}")
+        selected.update(range(first - 1, last))
+    return selected
+
+def prompt_selection(header: str, items: List[str], question: str) -> Set[int]:
+    """
+    Shows a numbered list of pending actions and asks once which of them to
+    run, instead of confirming every file separately.
+    Returns the 0-based indices of the selected items.
+    """
+    click.echo(header)
+    for number, item in enumerate(items, start=1):
+        click.echo(f"  [{number}] {item}")
+    while True:
+        answer = click.prompt(f"{question} (e.g. 1,3-5, 'all' or 'none')", default="none")
+        try:
+            return parse_selection(answer, len(items))
+        except ValueError as exc:
+            logger.warning(f"Invalid selection: {exc}")
 
 # ------------------------------------------------------------------------------
 # CLI Commands
@@ -302,11 +941,17 @@ def cli(verbosity: str) -> None:
 
 @cli.command()
 @click.argument("profile", required=True)
-def sync(profile: str) -> None:
+@click.option("--quiet", "-q", is_flag=True, help="Suppress per-file messages and print a summary instead.")
+@click.option("--dry-run", is_flag=True, help="Only report what would change, from sizes and dates alone.")
+def sync(profile: str, quiet: bool, dry_run: bool) -> None:
     """
     Synchronize the specified PROFILE between KIS and Client.
     """
-    log_ascii_message("SharePoint Sync")
+    click.get_current_context().call_on_close(close_follow_up_file)
+
+    # The banner is only for people watching; skip it when output is piped
+    if sys.stdout.isatty():
+        log_ascii_message("SharePoint Sync")
 
     profiles = load_profiles()
     if profile not in profiles["profiles"]:
@@ -331,12 +976,17 @@ def sync(profile: str) -> None:
         return
 
     # Compare sharepoints
-    kis_only, client_only, moved_files, updated_files = compare_sharepoints(
-        sync_profile.kis_dir,
-        sync_profile.client_dir,
-        excluded_files,
-        excluded_dirs
-    )
+    try:
+        kis_only, client_only, moved_files, updated_files = compare_sharepoints(
+            sync_profile.kis_dir,
+            sync_profile.client_dir,
+            excluded_files,
+            excluded_dirs,
+            read_content=not dry_run
+        )
+    except OSError as exc:
+        logger.error(f"{exc}")
+        return
 
     to_be_created_client = len(kis_only)
     to_be_created_kis = len(client_only)
@@ -355,16 +1005,37 @@ def sync(profile: str) -> None:
         logger.info(f"KIS and {profile} SharePoints are already in sync. 😎")
         return
 
+    if dry_run:
+        # Report only: no file content is read, diffed, copied or moved
+        report = [f"WOULD COPY KIS -> {profile}: {rel_path}" for rel_path in sorted(kis_only)]
+        report += [f"WOULD COPY {profile} -> KIS: {rel_path}" for rel_path in sorted(client_only)]
+        report += [
+            f"WOULD MOVE {file_name}: KIS '/{kis_rel_path}' <-> {profile} '/{client_rel_path}'"
+            for kis_rel_path, (file_name, client_rel_path, _) in sorted(moved_files.items())
+        ]
+        for rel_path, latest_file_abs in sorted(updated_files.items()):
+            if latest_file_abs == sync_profile.kis_dir / rel_path:
+                report.append(f"WOULD UPDATE {rel_path} (KIS -> {profile})")
+            else:
+                report.append(f"WOULD UPDATE {rel_path} ({profile} -> KIS)")
+        click.echo("\n".join(report))
+        return
+
     # Handle files that exist only in KIS -> create on Client
     if to_be_created_client:
         logger.debug("Handling files that exist only on KIS.")
-        for relative_path in kis_only:
-            logger.info(f"File {relative_path} found on KIS only, missing on {profile}.")
+        kis_only_paths = sorted(kis_only)
+        selected = prompt_selection(
+            f"Files found on KIS only, missing on {profile}:",
+            kis_only_paths,
+            f"Copy which files from KIS to {profile}?"
+        )
+        copies = []
+        for index, relative_path in enumerate(kis_only_paths):
             origin = sync_profile.kis_dir / relative_path
             target = sync_profile.client_dir / relative_path
-            if click.confirm(f"Copy {relative_path} from KIS to {profile}?"):
-                os.makedirs(target.parent, exist_ok=True)
-                shutil.copy2(origin, target)
+            if index in selected:
+                copies.append((origin, target))
             else:
                 log_follow_up(
                     f"You chose NOT to copy '{relative_path}' from KIS to {profile}.\n"
@@ -372,17 +1043,23 @@ def sync(profile: str) -> None:
                     f" - KIS path: {origin}\n"
                     f" - {profile} path: {target}\n"
                 )
+        copy_files(copies, f"from KIS to {profile}")
 
     # Handle files that exist only in Client -> create on KIS
     if to_be_created_kis:
         logger.debug("Handling files that exist only on Client.")
-        for relative_path in client_only:
-            logger.info(f"File {relative_path} found on {profile} only, missing on KIS.")
+        client_only_paths = sorted(client_only)
+        selected = prompt_selection(
+            f"Files found on {profile} only, missing on KIS:",
+            client_only_paths,
+            f"Copy which files from {profile} to KIS?"
+        )
+        copies = []
+        for index, relative_path in enumerate(client_only_paths):
             origin = sync_profile.client_dir / relative_path
             target = sync_profile.kis_dir / relative_path
-            if click.confirm(f"Copy {relative_path} from {profile} to KIS?"):
-                os.makedirs(target.parent, exist_ok=True)
-                shutil.copy2(origin, target)
+            if index in selected:
+                copies.append((origin, target))
             else:
                 # User chose NO, so log a follow-up task
                 log_follow_up(
@@ -391,16 +1068,23 @@ def sync(profile: str) -> None:
                     f" - {profile} path: {origin}\n"
                     f" - KIS path: {target}\n"
                 )
+        copy_files(copies, f"from {profile} to KIS")
+
+    # Per-file messages skipped in quiet mode, reported as totals at the end
+    identical_moves = 0
+    modified_on_kis = 0
+    modified_on_client = 0
 
     # Handle moved files
     if to_be_moved:
         logger.debug("Handling moved files.")
-        for file_name, (kis_rel_path, client_rel_path) in moved_files.items():
+        moves = []
+        for kis_rel_path, (file_name, client_rel_path, identical) in moved_files.items():
             kis_abs_path = sync_profile.kis_dir / kis_rel_path
             client_abs_path = sync_profile.client_dir / client_rel_path
 
-            logger.debug(f"KIS Relative Path: {kis_rel_path}")
-            logger.debug(f"Client Relative Path: {client_rel_path}")
+            logger.debug("KIS Relative Path: %s", kis_rel_path)
+            logger.debug("Client Relative Path: %s", client_rel_path)
 
             if (
                 kis_abs_path.exists()
@@ -415,6 +1099,7 @@ def sync(profile: str) -> None:
                     outdated_sharepoint = profile
                     outdated_rel_path = client_rel_path
                     latest_rel_path = kis_rel_path
+                    outdated_root = sync_profile.client_dir
                 else:
                     latest_abs = client_abs_path
                     outdated_abs = kis_abs_path
@@ -422,70 +1107,69 @@ def sync(profile: str) -> None:
                     outdated_sharepoint = "KIS"
                     outdated_rel_path = kis_rel_path
                     latest_rel_path = client_rel_path
+                    outdated_root = sync_profile.kis_dir
 
-                if (filecmp.cmp(kis_abs_path, client_abs_path, shallow=False)):
+                if identical:
                     logger.debug("File exists in both locations and they are identical.")
-                    logger.info(
-                    f"The file '{file_name}' was moved on {latest_sharepoint} "
-                    f"(file content is the same in both)."
-                    )
+                    identical_moves += 1
+                    if not quiet:
+                        logger.info(
+                        f"The file '{file_name}' was moved on {latest_sharepoint} "
+                        f"(file content is the same in both)."
+                        )
                 else:
                     # If they are not identical, that suggests a conflict or partial move scenario
                     logger.warning(
                         f"Potentially conflicting move for '{file_name}'. "
                         "Files differ and were moved. Proceed with caution."
                     )
-                    if latest_rel_path.endswith(".docx"):
+                    if latest_rel_path.lower().endswith(DIFFABLE_EXTS):
                         show_file_diff(outdated_abs, latest_abs)
 
-                
-                destination_dir = (
-                    sync_profile.client_dir / latest_rel_path
-                ).parent if outdated_sharepoint == profile else (
-                    sync_profile.kis_dir / latest_rel_path
-                ).parent
-
-                source_path = (
-                    sync_profile.client_dir / outdated_rel_path
-                ) if outdated_sharepoint == profile else (
-                    sync_profile.kis_dir / outdated_rel_path
-                )
+                # Move the outdated copy to the latest copy's path on its own side
+                moves.append((
+                    file_name, outdated_abs, outdated_root / latest_rel_path,
+                    outdated_rel_path, latest_rel_path, latest_sharepoint, outdated_sharepoint
+                ))
 
-                destination_path = (
-                    sync_profile.client_dir / latest_rel_path
-                ) if outdated_sharepoint == profile else (
-                    sync_profile.kis_dir / latest_rel_path
-                )        
-
-                if click.confirm(
-                    f"Move {file_name} on {outdated_sharepoint} from '/{outdated_rel_path}' "
-                    f"to '/{latest_rel_path}' to match {latest_sharepoint}?"
-                ):
-
-                    try:
-                        os.makedirs(destination_dir, exist_ok=True)
-                        shutil.move(str(source_path), str(destination_path))
-                        logger.info(f"Successfully moved {file_name} to match structure.")
-                    except FileNotFoundError:
-                        logger.error(f"Move failed: {source_path} does not exist!")
-                    except PermissionError:
-                        logger.error(f"Move failed: Permission denied.")
-                    except shutil.Error as err:
-                        logger.error(f"Move failed: {err}")
-                else:
-                    log_follow_up(
-                        f"You chose NOT to move '{file_name}' from '{outdated_sharepoint}' "
-                        f"path '/{outdated_rel_path}' to '/{latest_rel_path}' to match '{latest_sharepoint}'.\n"
-                        f"Please manually check:\n"
-                        f" - Outdated file path: {source_path}\n"
-                        f" - Destination path: {destination_path}\n"
-                    )
-            
+        selected: Set[int] = set()
+        if moves:
+            selected = prompt_selection(
+                "Files moved on one SharePoint since the last sync:",
+                [
+                    f"{file_name} on {outdated}: '/{old_rel}' -> '/{new_rel}' (to match {latest})"
+                    for file_name, _, _, old_rel, new_rel, latest, outdated in moves
+                ],
+                "Move which files to match the other SharePoint?"
+            )
+        for index, move in enumerate(moves):
+            (file_name, source_path, destination_path, outdated_rel_path,
+             latest_rel_path, latest_sharepoint, outdated_sharepoint) = move
+            if index in selected:
+                try:
+                    os.makedirs(destination_path.parent, exist_ok=True)
+                    shutil.move(str(source_path), str(destination_path))
+                    logger.info(f"Successfully moved {file_name} to match structure.")
+                except FileNotFoundError:
+                    logger.error(f"Move failed: {source_path} does not exist!")
+                except PermissionError:
+                    logger.error(f"Move failed: Permission denied.")
+                except shutil.Error as err:
+                    logger.error(f"Move failed: {err}")
+            else:
+                log_follow_up(
+                    f"You chose NOT to move '{file_name}' from '{outdated_sharepoint}' "
+                    f"path '/{outdated_rel_path}' to '/{latest_rel_path}' to match '{latest_sharepoint}'.\n"
+                    f"Please manually check:\n"
+                    f" - Outdated file path: {source_path}\n"
+                    f" - Destination path: {destination_path}\n"
+                )
 
     # Handle updated files
     if to_be_updated:
         logger.debug("Handling updated files.")
-        for rel_path, latest_file_abs in updated_files.items():
+        updates = []
+        for rel_path, latest_file_abs in sorted(updated_files.items()):
             kis_abs_path = sync_profile.kis_dir / rel_path
             client_abs_path = sync_profile.client_dir / rel_path
 
@@ -493,36 +1177,36 @@ def sync(profile: str) -> None:
                 latest_sharepoint = "KIS"
                 outdated_sharepoint = profile
                 outdated_file_abs = client_abs_path
+                modified_on_kis += 1
             else:
                 latest_sharepoint = profile
                 outdated_sharepoint = "KIS"
                 outdated_file_abs = kis_abs_path
+                modified_on_client += 1
 
-            logger.info(
-                f"The file '{rel_path}' was modified on {latest_sharepoint}."
-            )
+            if not quiet:
+                logger.info(
+                    f"The file '{rel_path}' was modified on {latest_sharepoint}."
+                )
 
-            # Display diff if it's a docx file
-            if rel_path.endswith(".docx"):
+            # Display diff if it's a Word document
+            if rel_path.lower().endswith(DIFFABLE_EXTS):
                 show_file_diff(outdated_file_abs, latest_file_abs)
 
-            if click.confirm(
-                f"Copy '{rel_path}' from {latest_sharepoint} to {outdated_sharepoint}?"
-            ):
-                try:
-                    shutil.copy2(latest_file_abs, outdated_file_abs)
-                    logger.info(
-                        f"Successfully copied '{rel_path}' "
-                        f"from {latest_sharepoint} to {outdated_sharepoint}."
-                    )
-                except FileNotFoundError:
-                    logger.error(f"Source file {latest_file_abs} does not exist.")
-                except PermissionError:
-                    logger.error(f"Permission denied while copying {latest_file_abs}.")
-                except shutil.SameFileError:
-                    logger.warning("Source and destination are the same file.")
-                except Exception as exc:
-                    logger.exception(f"Unexpected error during file copy: {exc}")
+            updates.append(
+                (rel_path, latest_file_abs, outdated_file_abs, latest_sharepoint, outdated_sharepoint)
+            )
+
+        selected = prompt_selection(
+            "Files modified on one SharePoint since the last sync:",
+            [f"{rel_path} ({latest} -> {outdated})" for rel_path, _, _, latest, outdated in updates],
+            "Copy which files over their outdated version?"
+        )
+        copies = []
+        for index, update in enumerate(updates):
+            rel_path, latest_file_abs, outdated_file_abs, latest_sharepoint, outdated_sharepoint = update
+            if index in selected:
+                copies.append((latest_file_abs, outdated_file_abs))
             else:
                 log_follow_up(
                     f"You chose NOT to copy '{rel_path}' from {latest_sharepoint} to {outdated_sharepoint}.\n"
@@ -530,6 +1214,14 @@ def sync(profile: str) -> None:
                     f" - Latest file: {latest_file_abs}\n"
                     f" - Outdated file: {outdated_file_abs}\n"
                 )
+        copy_files(copies, "over their outdated versions")
+
+    if quiet:
+        logger.info(
+            f"Summary: {modified_on_kis} files modified on KIS, {modified_on_client} on "
+            f"{profile}, {identical_moves} moves with identical content."
+        )
+    logger.debug("Word text cache: %s", read_docx_text.cache_info())
 
 @cli.command()
 @click.argument("dir_name", required=True)